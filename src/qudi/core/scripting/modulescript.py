@@ -146,6 +146,30 @@ class ModuleScript(QtCore.QObject, metaclass=QudiObjectMeta):
         with self._thread_lock:
             self._interrupted = True
 
+    def reset(self) -> None:
+        """ Resets arguments, result and status flags in order to reuse this instance for another
+        run. Must not be called while running.
+
+        DO NOT OVERRIDE IN SUBCLASS!
+        """
+        with self._thread_lock:
+            if self._running:
+                raise RuntimeError(f'Unable to reset "{self.__class__.__name__}" while running')
+            self._interrupted = True
+            self._success = False
+        self.args = tuple()
+        self.kwargs = dict()
+        self.result = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """ Optional procedure to reset custom instance state that has been set in __init__ or
+        during a previous run. Called by reset() before this instance is reused for another run.
+
+        Implement in subclass if needed.
+        """
+        pass
+
     def __call__(self, *args, **kwargs) -> Any:
         """ Convenience magic method to run this script like a function
         DO NOT OVERRIDE IN SUBCLASS!
@@ -93,6 +93,10 @@ class ModuleTask(ModuleScript):
     The implementations must occasionally call _check_interrupt() to raise an exception at that
     point if an interrupt is requested. This should happen at points where _cleanup() can
     properly terminate the task afterwards.
+
+    The task runner reuses a single instance per configured task for all runs of this task.
+    Any custom instance state set in __init__, _setup() or _run() will carry over into the next
+    run. Implement _reset() in a subclass to restore such state before each reuse.
     """
 
     sigStateChanged = QtCore.Signal(str)  # new state name
@@ -51,8 +51,8 @@ class ThreadManager(QtCore.QAbstractListModel):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._threads = list()
-        self._thread_names = list()
+        self._threads = dict()  # registered threads by name in order of registration
+        self._thread_names = list()  # thread names by model row
 
     @classmethod
     def instance(cls):
@@ -75,7 +75,7 @@ class ThreadManager(QtCore.QAbstractListModel):
         """
         with self._lock:
             logger.debug('Creating thread: "{0}".'.format(name))
-            if name in self._thread_names:
+            if name in self._threads:
                 return None
             thread = QtCore.QThread()
             thread.setObjectName(name)
@@ -90,8 +90,8 @@ class ThreadManager(QtCore.QAbstractListModel):
         """
         with self._lock:
             name = thread.objectName()
-            if name in self._thread_names:
-                if self.get_thread_by_name(name) is thread:
+            if name in self._threads:
+                if self._threads[name] is thread:
                     return None
                 raise RuntimeError(
                     f'Different thread with name "{name}" already registered in ThreadManager'
@@ -99,7 +99,7 @@ class ThreadManager(QtCore.QAbstractListModel):
 
             row = len(self._threads)
             self.beginInsertRows(QtCore.QModelIndex(), row, row)
-            self._threads.append(thread)
+            self._threads[name] = thread
             self._thread_names.append(name)
             thread.finished.connect(
                 partial(self.unregister_thread, name=name), QtCore.Qt.QueuedConnection)
@@ -114,14 +114,14 @@ class ThreadManager(QtCore.QAbstractListModel):
         with self._lock:
             if isinstance(name, QtCore.QThread):
                 name = name.objectName()
-            if name in self._thread_names:
-                index = self._thread_names.index(name)
-                if self._threads[index].isRunning():
+            if name in self._threads:
+                if self._threads[name].isRunning():
                     self.quit_thread(name)
                     return
                 logger.debug('Cleaning up thread {0}.'.format(name))
+                index = self._thread_names.index(name)
                 self.beginRemoveRows(QtCore.QModelIndex(), index, index)
-                del self._threads[index]
+                del self._threads[name]
                 del self._thread_names[index]
                 self.endRemoveRows()
 
@@ -169,7 +169,7 @@ class ThreadManager(QtCore.QAbstractListModel):
         """
         with self._lock:
             logger.debug('Quit all threads.')
-            for thread in self._threads:
+            for thread in self._threads.values():
                 thread.quit()
                 if not thread.wait(int(thread_timeout)):
                     logger.error('Waiting for thread {0} timed out.'.format(thread.objectName()))
@@ -181,11 +181,7 @@ class ThreadManager(QtCore.QAbstractListModel):
         @return QThread: The registered thread object
         """
         with self._lock:
-            try:
-                index = self._thread_names.index(name)
-                return self._threads[index]
-            except ValueError:
-                return None
+            return self._threads.get(name, None)
 
     # QAbstractListModel interface methods follow below
     def rowCount(self, parent=None, *args, **kwargs):
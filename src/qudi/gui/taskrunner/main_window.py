@@ -113,10 +113,10 @@ class TaskMainWindow(QtWidgets.QMainWindow):
 
     def _clear_task_widgets(self) -> None:
         """ Helper method to disconnect and delete all TaskWidgets and remove them from layout """
-        for widget in reversed(self.task_widgets):
+        for widget in reversed(self.task_widgets.values()):
             groupbox = widget.parent()
-            widget.sigStartTask.disconnect()
-            widget.sigInterruptTask.disconnect()
+            # Silence all widget signals at once. Connections are released upon deletion.
+            widget.blockSignals(True)
             self.tasks_layout.removeWidget(groupbox)
             groupbox.setParent(None)
             groupbox.deleteLater()
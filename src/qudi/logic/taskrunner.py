@@ -19,7 +19,7 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
-from functools import partial
+from collections import deque
 from PySide2 import QtCore
 from typing import Any, Type, Mapping, List, Dict
 
@@ -41,41 +41,67 @@ class TaskRunnerLogic(LogicBase):
     sigTaskStarted = QtCore.Signal(str)  # task name
     sigTaskStateChanged = QtCore.Signal(str, str)  # task name, task state
     sigTaskFinished = QtCore.Signal(str, object, bool)  # task name, result, success flag
-    _sigStartTask = QtCore.Signal(str, dict)  # task name, args, kwargs
+    _sigStartTask = QtCore.Signal()  # start next pending task
+
+    _thread_join_timeout = 10000  # Max. time in ms to wait for each task thread on deactivation
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._thread_lock = Mutex()
         self._running_tasks = dict()
+        self._pending_tasks = deque()  # (task name, arguments) waiting to be started
+        self._task_pool = dict()  # idle ModuleTask instances to reuse, one per task name
+        self._task_threads = dict()  # persistent worker QThread per task name
         self._configured_task_types = dict()
+        self._task_connect_specs = dict()  # (connector name, module name) pairs per task name
         self._consecutive_activation = False  # Flag indicating consecutive activations
 
     def on_activate(self) -> None:
         """ Initialise task runner """
         self._running_tasks = dict()
+        self._pending_tasks = deque()
+        self._task_pool = dict()
         self._configured_task_types = dict()
+        self._task_connect_specs = dict()
+        # Several task names can share the same ModuleTask class. Import (or reload) each class
+        # only once per activation.
+        imported_types = dict()
         for name, task_cfg in self._module_task_configs.items():
             if name in self._configured_task_types:
                 raise KeyError(f'Duplicate task name "{name}" encountered in config')
             module, cls = task_cfg['module.Class'].rsplit('.', 1)
-            task = import_module_script(module, cls, reload=self._consecutive_activation)
-            if not issubclass(task, ModuleTask):
-                raise TypeError('Configured task is not a ModuleTask (sub)class')
+            task = imported_types.get((module, cls), None)
+            if task is None:
+                task = import_module_script(module, cls, reload=self._consecutive_activation)
+                if not issubclass(task, ModuleTask):
+                    raise TypeError('Configured task is not a ModuleTask (sub)class')
+                imported_types[(module, cls)] = task
             self._configured_task_types[name] = task
-        self._sigStartTask.connect(self._run_task, QtCore.Qt.QueuedConnection)
+            self._task_connect_specs[name] = tuple(task_cfg.get('connect', dict()).items())
+        self.__create_task_threads()
+        self._sigStartTask.connect(self._start_next_pending_task, QtCore.Qt.QueuedConnection)
         self._consecutive_activation = True
 
     def on_deactivate(self) -> None:
         """ Shut down task runner """
         self._sigStartTask.disconnect()
-        for task in self._running_tasks.values():
-            task.interrupt
+        with self._thread_lock:
+            self._pending_tasks.clear()
+            running_tasks = list(self._running_tasks.values())
+        # Interrupt all running tasks first so they can wind down concurrently
+        for task in running_tasks:
+            task.interrupt()
+        self.__quit_task_threads()
+        self._task_pool = dict()
         self._configured_task_types = dict()
+        self._task_connect_specs = dict()
 
     @property
     def running_tasks(self) -> List[str]:
-        with self._thread_lock:
-            return list(self._running_tasks)
+        """ Point-in-time snapshot of the names of currently running tasks.
+        No lock needed since copying the dict keys into a list is atomic (GIL).
+        """
+        return list(self._running_tasks)
 
     @property
     def task_states(self) -> Dict[str, str]:
@@ -94,7 +120,16 @@ class TaskRunnerLogic(LogicBase):
 
     def run_task(self, name: str, arguments: Mapping[str, Any]) -> None:
         with self._thread_lock:
-            self._sigStartTask.emit(name, dict(arguments))
+            # Only trigger processing if the queue was empty. Otherwise the pending start request
+            # in front will trigger the next one when it is done.
+            trigger = not self._pending_tasks
+            self._pending_tasks.append((name, dict(arguments)))
+        if trigger:
+            if QtCore.QThread.currentThread() is self.thread():
+                # Called from within the thread of this module. Skip the event loop round trip.
+                self._start_next_pending_task()
+            else:
+                self._sigStartTask.emit()
 
     def interrupt_task(self, name: str) -> None:
         with self._thread_lock:
@@ -103,92 +138,142 @@ class TaskRunnerLogic(LogicBase):
                 raise RuntimeError(f'No ModuleTask with name "{name}" running')
             task.interrupt()
 
-    @QtCore.Slot(str, dict)
-    def _run_task(self, name: str, arguments: Mapping[str, Any]) -> None:
+    @QtCore.Slot()
+    def _start_next_pending_task(self) -> None:
+        """ Start the task at the front of the pending queue and trigger the next one if there are
+        more pending start requests.
+        """
         with self._thread_lock:
+            if not self._pending_tasks:
+                return
+            # Leave the entry in the queue until it has been processed so that run_task does not
+            # trigger processing in the meantime.
+            name, arguments = self._pending_tasks[0]
+            try:
+                self._run_task(name, arguments)
+            finally:
+                self._pending_tasks.popleft()
+                if self._pending_tasks:
+                    self._sigStartTask.emit()
+
+    def _run_task(self, name: str, arguments: Mapping[str, Any]) -> None:
+        """ Initialize, connect and start a task. Must be called with self._thread_lock held. """
+        stage = 'initialization'
+        task = None
+        try:
             task = self.__init_task(name)
+            stage = 'setting of arguments'
             self.__set_task_arguments(task, arguments)
+            stage = 'modules connection'
             self.__activate_connect_task_modules(name, task)
-            self.__move_task_into_thread(name, task)
-            self.__connect_task_signals(name, task)
-            self.__start_task(name, task)
-            self.sigTaskStarted.emit(name)
-
-    def _task_finished_callback(self, name: str) -> None:
-        """ Called every time a task finishes """
-        with self._thread_lock:
-            task = self._running_tasks.get(name, None)
+        except:
+            self.log.exception(f'Exception during {stage} of ModuleTask "{name}":')
             if task is not None:
-                task.sigFinished.disconnect()
-                task.sigStateChanged.disconnect()
                 task.disconnect_modules()
-                thread_manager = self._qudi_main.thread_manager
-                thread_manager.quit_thread(task.thread())
-                thread_manager.join_thread(task.thread())
+                # Task has never been started. Keep it for the next run.
+                self._task_pool[name] = task
+            raise
+        self.__start_task(name, task)
+        self.sigTaskStarted.emit(name)
 
-    def _thread_finished_callback(self, name: str) -> None:
+    @QtCore.Slot()
+    def _task_finished_callback(self) -> None:
+        """ Called every time a task finishes """
+        task = self.sender()
+        # Sender is None if the task has already been deleted, e.g. after a re-activation
+        if task is None:
+            return
+        name = task.objectName()
+        task.disconnect_modules()
         with self._thread_lock:
-            task = self._running_tasks.pop(name, None)
-            if task is not None:
-                self.sigTaskFinished.emit(name, task.result, task.success)
+            # Ignore stale tasks still finishing from before a re-activation
+            if self._running_tasks.get(name, None) is not task:
+                return
+            del self._running_tasks[name]
+            self.sigTaskFinished.emit(name, task.result, task.success)
+            # Keep the idle instance for the next run
+            self._task_pool[name] = task
 
-    def _task_state_changed_callback(self, state: str, name: str) -> None:
-        self.sigTaskStateChanged.emit(name, state)
+    @QtCore.Slot(str)
+    def _task_state_changed_callback(self, state: str) -> None:
+        task = self.sender()
+        # Sender is None if the task has already been deleted, e.g. after a re-activation
+        if task is not None:
+            self.sigTaskStateChanged.emit(task.objectName(), state)
 
     def __init_task(self, name: str) -> ModuleTask:
-        """ Create a ModuleTask instance """
-        try:
-            if name in self._running_tasks:
-                raise RuntimeError(f'ModuleTask "{name}" is already initialized')
-            return self._configured_task_types[name]()
-        except:
-            self.log.exception(f'Exception during initialization of ModuleTask "{name}":')
-            raise
+        """ Reuse an idle ModuleTask instance from the pool or create a new one """
+        if name in self._running_tasks:
+            raise RuntimeError(f'ModuleTask "{name}" is already initialized')
+        task = self._task_pool.pop(name, None)
+        if task is None:
+            task = self._configured_task_types[name]()
+            task.setObjectName(name)
+            self.__move_task_into_thread(name, task)
+            self.__connect_task_signals(name, task)
+        else:
+            task.reset()
+        return task
 
     def __set_task_arguments(self, task: ModuleTask, arguments: Mapping[str, Any]) -> None:
         """ Set arguments for ModuleTask instance """
-        try:
-            if not (isinstance(arguments, Mapping) and all(isinstance(a, str) for a in arguments)):
-                raise TypeError('ModuleTask kwargs must be mapping with str type keys')
-            task.kwargs = arguments
-        except:
-            self.log.exception(f'Exception during setting of arguments for ModuleTask:')
-            raise
+        # Arguments arrive as plain dict from run_task. Only fall back to the (slow) ABC check for
+        # other types.
+        is_mapping = type(arguments) is dict or isinstance(arguments, Mapping)
+        if not (is_mapping and all(isinstance(a, str) for a in arguments)):
+            raise TypeError('ModuleTask kwargs must be mapping with str type keys')
+        task.kwargs = arguments
 
     def __activate_connect_task_modules(self, name: str, task: ModuleTask) -> None:
         """ Activate and connect all configured module connectors for ModuleTask """
-        try:
-            module_manager = self._qudi_main.module_manager
-            connect_targets = dict()
-            for conn_name, module_name in self._module_task_configs[name]['connect'].items():
-                module = module_manager[module_name]
-                module.activate()
-                connect_targets[conn_name] = module.instance
-            task.connect_modules(connect_targets)
-        except:
-            self.log.exception(f'Exception during modules connection for ModuleTask "{name}":')
-            task.disconnect_modules()
-            raise
+        module_manager = self._qudi_main.module_manager
+        connect_targets = dict()
+        for conn_name, module_name in self._task_connect_specs[name]:
+            module = module_manager[module_name]
+            module.activate()
+            connect_targets[conn_name] = module.instance
+        task.connect_modules(connect_targets)
 
-    def __move_task_into_thread(self, name: str, task: ModuleTask) -> None:
-        """ Create a new QThread via qudi thread manager and move ModuleTask instance into it """
+    def __create_task_threads(self) -> None:
+        """ Create and start a persistent QThread via qudi thread manager for each configured
+        task name. ModuleTask instances live in these threads for their entire lifetime.
+        """
+        self._task_threads = dict()
+        thread_manager = self._qudi_main.thread_manager
         try:
-            thread = self._qudi_main.thread_manager.get_new_thread(name=f'ModuleTask-{name}')
-            if thread is None:
-                raise RuntimeError(f'Unable to create QThread with name "ModuleTask-{name}"')
+            for name in self._configured_task_types:
+                thread = thread_manager.get_new_thread(name=f'ModuleTask-{name}')
+                if thread is None:
+                    raise RuntimeError(f'Unable to create QThread with name "ModuleTask-{name}"')
+                thread.start()
+                self._task_threads[name] = thread
         except RuntimeError:
             self.log.exception('Exception during thread creation:')
+            self.__quit_task_threads()
             raise
-        task.moveToThread(thread)
-        thread.started.connect(task.run, QtCore.Qt.QueuedConnection)
-        thread.finished.connect(partial(self._thread_finished_callback, name=name))
+
+    def __quit_task_threads(self) -> None:
+        """ Stop and join all persistent task threads.
+        Quits all threads before joining them, so they shut down concurrently.
+        """
+        thread_manager = self._qudi_main.thread_manager
+        for thread in self._task_threads.values():
+            thread_manager.quit_thread(thread)
+        for thread in self._task_threads.values():
+            thread_manager.join_thread(thread, time=self._thread_join_timeout)
+            if thread.isRunning():
+                self.log.error(f'Waiting for thread "{thread.objectName()}" timed out.')
+        self._task_threads = dict()
+
+    def __move_task_into_thread(self, name: str, task: ModuleTask) -> None:
+        """ Move ModuleTask instance into the persistent thread for this task name """
+        task.moveToThread(self._task_threads[name])
 
     def __connect_task_signals(self, name: str, task: ModuleTask) -> None:
-        task.sigFinished.connect(partial(self._task_finished_callback, name=name),
-                                 QtCore.Qt.QueuedConnection)
-        task.sigStateChanged.connect(partial(self._task_state_changed_callback, name=name),
-                                     QtCore.Qt.QueuedConnection)
+        # The task objectName is the task name. Callbacks use self.sender() to identify the task.
+        task.sigFinished.connect(self._task_finished_callback, QtCore.Qt.QueuedConnection)
+        task.sigStateChanged.connect(self._task_state_changed_callback, QtCore.Qt.QueuedConnection)
 
     def __start_task(self, name: str, task: ModuleTask) -> None:
         self._running_tasks[name] = task
-        task.thread().start()
+        QtCore.QMetaObject.invokeMethod(task, 'run', QtCore.Qt.QueuedConnection)